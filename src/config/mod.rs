@@ -485,12 +485,13 @@ impl SchedulerEngineMode {
 
 pub fn load_settings_env() -> Result<HashMap<String, String>> {
     let path = settings_path();
-    if !path.exists() {
-        return Ok(HashMap::new());
-    }
-
-    let content =
-        fs::read_to_string(&path).with_context(|| format!("failed to read {}", path.display()))?;
+    let content = match fs::read_to_string(&path) {
+        Ok(content) => content,
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => return Ok(HashMap::new()),
+        Err(err) => {
+            return Err(err).with_context(|| format!("failed to read {}", path.display()));
+        }
+    };
     let settings: ClaudeSettings =
         serde_json::from_str(&content).context("failed to parse ~/.claude/settings.json")?;
     Ok(settings.env)
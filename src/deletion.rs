@@ -481,7 +481,7 @@ impl RuntimeHost {
                 continue;
             }
             // Check if the worktree is clean (no uncommitted changes).
-            if self.worktree_is_dirty(worktree_path) {
+            if self.worktree_is_dirty(worktree_path).await {
                 return Err(anyhow!(
                     "worktree {} at {} has uncommitted changes; resolve before deletion can proceed",
                     root.execution_root_id,
@@ -489,7 +489,7 @@ impl RuntimeHost {
                 ));
             }
             // Safe to remove.
-            self.remove_worktree_directory(worktree_path)?;
+            self.remove_worktree_directory(worktree_path).await?;
             self.runtime_db()
                 .execution_root_entries()
                 .mark_removed(&root.execution_root_id)?;
@@ -650,11 +650,12 @@ impl RuntimeHost {
     }
 
     /// Check if a git worktree has uncommitted changes.
-    fn worktree_is_dirty(&self, path: &Path) -> bool {
-        let output = std::process::Command::new("git")
+    async fn worktree_is_dirty(&self, path: &Path) -> bool {
+        let output = tokio::process::Command::new("git")
             .args(["status", "--porcelain"])
             .current_dir(path)
-            .output();
+            .output()
+            .await;
         match output {
             Ok(output) => !output.stdout.is_empty(),
             Err(_) => true, // If we can't check, treat as dirty for safety.
@@ -662,18 +663,20 @@ impl RuntimeHost {
     }
 
     /// Remove a worktree directory (git worktree remove or fallback to rm).
-    fn remove_worktree_directory(&self, path: &Path) -> Result<()> {
+    async fn remove_worktree_directory(&self, path: &Path) -> Result<()> {
         // Try git worktree remove first for clean git state.
-        let output = std::process::Command::new("git")
+        let output = tokio::process::Command::new("git")
             .args(["worktree", "remove", "--force"])
             .arg(path)
-            .output();
+            .output()
+            .await;
         match output {
             Ok(output) if output.status.success() => return Ok(()),
             _ => {}
         }
         // Fallback: remove directory directly.
-        std::fs::remove_dir_all(path)
+        tokio::fs::remove_dir_all(path)
+            .await
             .with_context(|| format!("removing worktree directory {}", path.display()))
     }
 }
@@ -6,7 +6,7 @@ use anyhow::{Context, Result};
 use reqwest::Client;
 #[cfg(test)]
 use std::sync::atomic::{AtomicU64, Ordering};
-use std::{env, time::Duration};
+use std::{env, sync::OnceLock, time::Duration};
 
 pub use anthropic::AnthropicProvider;
 pub use gemini::GeminiProvider;
@@ -27,12 +27,27 @@ const DEFAULT_REQUEST_SEND_TIMEOUT_SECS: u64 = 300;
 const DEFAULT_STREAM_IDLE_TIMEOUT_MS: u64 = 300_000;
 #[cfg(test)]
 static STREAM_IDLE_TIMEOUT_OVERRIDE_MS: AtomicU64 = AtomicU64::new(0);
+static HTTP_TIMEOUT_SECS_ENV: OnceLock<Option<u64>> = OnceLock::new();
+static STREAM_IDLE_TIMEOUT_MS_ENV: OnceLock<Option<u64>> = OnceLock::new();
+static RESPONSE_BODY_TIMEOUT_SECS_ENV: OnceLock<Option<u64>> = OnceLock::new();
+
+/// Timeout env vars are consulted on every provider request, so each one is
+/// read and parsed once per process.
+fn positive_u64_env(cache: &OnceLock<Option<u64>>, name: &str) -> Option<u64> {
+    *cache.get_or_init(|| {
+        env::var(name)
+            .ok()
+            .and_then(|value| value.parse::<u64>().ok())
+            .filter(|value| *value > 0)
+    })
+}
+
+fn http_timeout_secs_env() -> Option<u64> {
+    positive_u64_env(&HTTP_TIMEOUT_SECS_ENV, "HOLON_PROVIDER_HTTP_TIMEOUT_SECS")
+}
 
 fn build_http_client() -> Result<Client> {
-    let timeout_secs = env::var("HOLON_PROVIDER_HTTP_TIMEOUT_SECS")
-        .ok()
-        .and_then(|value| value.parse::<u64>().ok())
-        .filter(|value| *value > 0);
+    let timeout_secs = http_timeout_secs_env();
     let mut builder = Client::builder();
     if let Some(timeout_secs) = timeout_secs {
         builder = builder.timeout(Duration::from_secs(timeout_secs));
@@ -48,11 +63,11 @@ pub(super) fn stream_idle_timeout() -> Duration {
             return Duration::from_millis(override_ms);
         }
     }
-    let timeout_ms = env::var("HOLON_PROVIDER_STREAM_IDLE_TIMEOUT_MS")
-        .ok()
-        .and_then(|value| value.parse::<u64>().ok())
-        .filter(|value| *value > 0)
-        .unwrap_or(DEFAULT_STREAM_IDLE_TIMEOUT_MS);
+    let timeout_ms = positive_u64_env(
+        &STREAM_IDLE_TIMEOUT_MS_ENV,
+        "HOLON_PROVIDER_STREAM_IDLE_TIMEOUT_MS",
+    )
+    .unwrap_or(DEFAULT_STREAM_IDLE_TIMEOUT_MS);
     Duration::from_millis(timeout_ms)
 }
 
@@ -62,19 +77,15 @@ pub(crate) fn set_stream_idle_timeout_override_for_tests(timeout_ms: Option<u64>
 }
 
 pub(super) fn request_send_timeout() -> Duration {
-    let timeout_secs = env::var("HOLON_PROVIDER_HTTP_TIMEOUT_SECS")
-        .ok()
-        .and_then(|value| value.parse::<u64>().ok())
-        .filter(|value| *value > 0)
-        .unwrap_or(DEFAULT_REQUEST_SEND_TIMEOUT_SECS);
+    let timeout_secs = http_timeout_secs_env().unwrap_or(DEFAULT_REQUEST_SEND_TIMEOUT_SECS);
     Duration::from_secs(timeout_secs)
 }
 
 pub(super) fn response_body_timeout() -> Duration {
-    let timeout_secs = env::var("HOLON_PROVIDER_RESPONSE_BODY_TIMEOUT_SECS")
-        .ok()
-        .and_then(|value| value.parse::<u64>().ok())
-        .filter(|value| *value > 0)
-        .unwrap_or(request_send_timeout().as_secs());
+    let timeout_secs = positive_u64_env(
+        &RESPONSE_BODY_TIMEOUT_SECS_ENV,
+        "HOLON_PROVIDER_RESPONSE_BODY_TIMEOUT_SECS",
+    )
+    .unwrap_or_else(|| request_send_timeout().as_secs());
     Duration::from_secs(timeout_secs)
 }
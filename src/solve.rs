@@ -362,13 +362,11 @@ fn write_run_artifacts(
     response: &RunOnceResponse,
 ) -> Result<()> {
     let run_json_path = output_dir.join("run.json");
-    fs::write(&run_json_path, serde_json::to_vec_pretty(response)?)
-        .with_context(|| format!("failed to write {}", run_json_path.display()))?;
+    write_artifact_atomically(&run_json_path, &serde_json::to_vec_pretty(response)?)?;
 
     let summary_path = output_dir.join("summary.md");
     if !summary_path.exists() {
-        fs::write(&summary_path, response.render_text())
-            .with_context(|| format!("failed to write {}", summary_path.display()))?;
+        write_artifact_atomically(&summary_path, response.render_text().as_bytes())?;
     }
 
     let manifest_path = output_dir.join("manifest.json");
@@ -393,8 +391,29 @@ fn write_run_artifacts(
             run_json: Some(run_json_path.display().to_string()),
             summary: Some(summary_path.display().to_string()),
         };
-        fs::write(&manifest_path, serde_json::to_vec_pretty(&manifest)?)
-            .with_context(|| format!("failed to write {}", manifest_path.display()))?;
+        write_artifact_atomically(&manifest_path, &serde_json::to_vec_pretty(&manifest)?)?;
+    }
+    Ok(())
+}
+
+/// Writes to a sibling temp file and renames it into place, so readers of the
+/// output directory never observe a partially written artifact.
+fn write_artifact_atomically(path: &Path, content: &[u8]) -> Result<()> {
+    let parent = path
+        .parent()
+        .ok_or_else(|| anyhow!("path {} has no parent directory", path.display()))?;
+    let temp_path = parent.join(format!(
+        ".{}.tmp-{}",
+        path.file_name()
+            .and_then(|name| name.to_str())
+            .unwrap_or("artifact"),
+        uuid::Uuid::new_v4().simple()
+    ));
+    fs::write(&temp_path, content)
+        .with_context(|| format!("failed to write {}", temp_path.display()))?;
+    if let Err(err) = fs::rename(&temp_path, path) {
+        let _ = fs::remove_file(&temp_path);
+        return Err(err).with_context(|| format!("failed to write {}", path.display()));
     }
     Ok(())
 }
@@ -480,6 +499,21 @@ mod tests {
         assert!(!prompt.contains("Review publishing guardrails"));
     }
 
+    #[test]
+    fn write_artifact_atomically_replaces_content_without_leaving_temp_files() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("manifest.json");
+        write_artifact_atomically(&path, b"first").unwrap();
+        write_artifact_atomically(&path, b"second").unwrap();
+
+        assert_eq!(fs::read_to_string(&path).unwrap(), "second");
+        let entries = fs::read_dir(dir.path())
+            .unwrap()
+            .map(|entry| entry.unwrap().file_name())
+            .collect::<Vec<_>>();
+        assert_eq!(entries, vec![std::ffi::OsString::from("manifest.json")]);
+    }
+
     #[test]
     fn agent_template_retry_only_matches_specific_create_agent_error() {
         let expected = anyhow!(
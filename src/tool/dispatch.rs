@@ -119,6 +119,7 @@ impl ToolRegistry {
         context: &ToolExecutionContext,
     ) -> Result<(ToolResult, ToolExecutionRecord)> {
         let started_at = chrono::Utc::now();
+        let started = std::time::Instant::now();
         let required_family = match self.family_for_tool(&call.name)? {
             Some(required_family) => required_family,
             None => {
@@ -190,10 +191,7 @@ impl ToolRegistry {
             "error": result.tool_error().cloned(),
         });
         let completed_at = chrono::Utc::now();
-        let duration_ms = completed_at
-            .signed_duration_since(started_at)
-            .num_milliseconds()
-            .max(0) as u64;
+        let duration_ms = started.elapsed().as_millis() as u64;
         let record = ToolExecutionRecord {
             id: crate::ids::tool_execution_id(),
             agent_id: agent_id.to_string(),
@@ -315,13 +315,15 @@ fn presentation_log_max_bytes_from_env() -> u64 {
 }
 
 fn append_jsonl<T: Serialize>(path: &Path, value: &T) -> Result<()> {
+    // One write_all per record keeps appended lines whole on the unbuffered file.
+    let mut line = serde_json::to_vec(value)?;
+    line.push(b'\n');
     let mut file = OpenOptions::new()
         .create(true)
         .append(true)
         .open(path)
         .with_context(|| format!("failed to open {}", path.display()))?;
-    let line = serde_json::to_string(value)?;
-    writeln!(file, "{line}")?;
+    file.write_all(&line)?;
     Ok(())
 }
 
@@ -351,7 +353,8 @@ fn append_bounded_jsonl_lines(path: &Path, lines: &[String], max_bytes: u64) ->
             ));
         }
         if let Some(open_writer) = writer.as_mut() {
-            writeln!(open_writer, "{line}")?;
+            open_writer.write_all(line.as_bytes())?;
+            open_writer.write_all(b"\n")?;
         }
         current_size += incoming_bytes;
     }